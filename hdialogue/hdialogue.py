@@ -26,22 +26,121 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import io
 import re
 import os
 import sys
 import time
 import json
 import lzma
+import pickle
 import argparse
 import textwrap
+import functools
 import subprocess
+import dataclasses
 import configparser
+import concurrent.futures
 
-# Non-standard-libs.  From my `hades` venv
-import slpp
+# Non-standard-libs.  From my `hades` venv.  (slpp, and the optional lupa,
+# get imported down in `_decode_lua` instead -- they're only needed on the
+# cold-cache Lua conversion path, and there's no reason for `-h` output or
+# a warm-cache run to pay for loading a whole Lua parser.)
 import appdirs
 
+# Optional; if available, we stream-parse the JSON caches rather than
+# materializing the full decompressed document up front.
+try:
+    import ijson
+except ModuleNotFoundError:
+    ijson = None
+
+# Optional; when available, new caches get written zstd-compressed instead
+# of LZMA.  Compression ratio on our JSON is comparable, but decompression
+# is something like an order of magnitude faster, which is where nearly all
+# of our warm-start time goes.
+try:
+    import zstandard
+except ModuleNotFoundError:
+    zstandard = None
+
+def _open_cache(filename, mode, **kwargs):
+    """
+    Open one of our compressed cache files, choosing the codec based on
+    the file extension (so pre-existing `.xz` caches keep working even
+    after `zstandard` shows up in the venv).
+    """
+    if filename.endswith('.zst'):
+        if mode.startswith('w'):
+            kwargs['cctx'] = zstandard.ZstdCompressor(level=3)
+        return zstandard.open(filename, mode, **kwargs)
+    return lzma.open(filename, mode, **kwargs)
+
+def _stringify_keys(data):
+    """
+    slpp hands us dicts whose numeric Lua table keys are ints.  The JSON
+    round-trip we used to do coerced those to strings, and all of our
+    parsing code expects string keys, so normalize pickled caches the
+    same way.
+    """
+    if data.__class__ is dict:
+        return {str(k): _stringify_keys(v) for k, v in data.items()}
+    elif data.__class__ is list:
+        return [_stringify_keys(v) for v in data]
+    else:
+        return data
+
+def _lua_to_python(value, lua_type):
+    """
+    Recursively convert a lupa Lua value into plain Python data, matching
+    what the slpp path produces: tables with consecutive 1..n keys become
+    lists, any other table becomes a dict with stringified keys, and
+    anything non-data (functions, userdata) becomes None.  `lua_type` is
+    `lupa.lua_type`, passed in since lupa gets imported lazily.
+    """
+    vtype = lua_type(value)
+    if vtype == 'table':
+        keys = list(value.keys())
+        if keys and keys == list(range(1, len(keys) + 1)):
+            return [_lua_to_python(value[k], lua_type) for k in keys]
+        return {str(k): _lua_to_python(v, lua_type) for k, v in value.items()}
+    elif vtype is None:
+        # Already a plain Python scalar
+        return value
+    else:
+        return None
+
+def _decode_lua(lua_str):
+    """
+    Decode one of our munged Lua-table strings into plain Python data.
+    Tries lupa (LuaJIT) first when it's available -- roughly an order of
+    magnitude faster than slpp on these multi-MB files -- and falls back
+    to slpp if lupa isn't installed or can't parse the script (slpp is
+    more forgiving of the not-quite-table-constructor syntax some of the
+    scripts use, like the dotted `UnitSetData.NPCs = ...` assignments).
+    Either way, numeric table keys come back stringified, matching the
+    old Lua->JSON round trip.
+    """
+    try:
+        import lupa
+    except ModuleNotFoundError:
+        lupa = None
+    if lupa is not None:
+        try:
+            runtime = lupa.LuaRuntime()
+            # The data files poke at a few globals we don't define
+            # (OverwriteTableKeys(), GlobalVoiceLines, ...); resolve any
+            # unknown global to a callable empty table so those lines
+            # evaluate harmlessly.
+            runtime.execute(
+                    'setmetatable(_G, {__index = function()'
+                    ' return setmetatable({}, {__call = function() return nil end})'
+                    ' end})')
+            return _lua_to_python(runtime.eval('(' + lua_str + ')'), lupa.lua_type)
+        except lupa.LuaError:
+            print('WARNING: lupa could not parse the script, falling back to slpp')
+    import slpp
+    return _stringify_keys(slpp.slpp.decode(lua_str))
+
 class OggLibrary:
     """
     The utility I use to extract the oggs (python-fsb5) writes out
@@ -53,17 +152,24 @@ class OggLibrary:
 
     If you use an extractor other than `python-fsb5`, the resulting oggs
     might follow a different naming pattern, and you may have to update
-    `ogg_re` to suit.
+    the prefix/suffix handling in the constructor to suit.
     """
 
-    ogg_re = re.compile(r'^(?P<prefix>VO-)(?P<vo>\S+)\.ogg$')
-
     def __init__(self, base_path):
         self.base_path = base_path
         self.oggs = {}
-        for filename in os.listdir(self.base_path):
-            if match := self.ogg_re.match(filename):
-                self.oggs[match.group('vo')] = os.path.join(self.base_path, filename)
+        # The naming schema is trivial enough that plain string slicing
+        # beats any flavor of regex matching here, and scandir hands us
+        # the joined path for free -- this dir can easily contain
+        # thousands of oggs.
+        intern = sys.intern
+        with os.scandir(self.base_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('VO-') and name.endswith('.ogg'):
+                    # Interned to match the interned Cue.cue values, so the
+                    # `cue in file_map` checks at play time can hit on identity
+                    self.oggs[intern(name[3:-4])] = entry.path
 
     def __contains__(self, key):
         return key in self.oggs
@@ -71,6 +177,19 @@ class OggLibrary:
     def __getitem__(self, key):
         return self.oggs[key]
 
+# Compiled once at import time; `_vo_match` gets bound here as well so the
+# hot parsing paths below can call it directly rather than re-resolving
+# `VO.vo_re.match` (two attribute lookups) per cue.
+_vo_re = re.compile(r'^/VO/(?P<cue>\S+)$')
+_vo_match = _vo_re.match
+
+# Shared wrapper for subtitle display; textwrap.wrap() constructs a fresh
+# TextWrapper on every call, so build ours just once.
+_wrapper = textwrap.TextWrapper(
+        initial_indent='     ',
+        subsequent_indent='     ',
+        )
+
 class NotACueException(Exception):
     """
     Used to indicate that the given JSON stanza isn't actually describing
@@ -89,6 +208,7 @@ class NoVOsException(Exception):
     any voiceovers (collections of cues) that we can play.
     """
 
+@dataclasses.dataclass(frozen=True, slots=True)
 class Cue:
     """
     Holds information about a single cue, which is a single line of dialogue
@@ -97,23 +217,32 @@ class Cue:
     the subtitles shown in the game, and any starting sounds which get played
     at the start of the line.  (The latter seems to be most frequently used
     for Cerberus sound effects.)
+
+    There are tens of thousands of these in a full dataset, so this is a
+    frozen+slotted dataclass: no per-instance `__dict__`, and the generated
+    `__init__`/`__eq__`/`__hash__` come essentially for free.  Anybody
+    needing to tweak a field (see the delay-zeroing in VO) goes through
+    `dataclasses.replace`.
     """
 
-    def __init__(self, cue, text=None, delay=0, start_sound=None, choice=None):
-        self.cue = cue
-        self.text = text
-        self.delay = delay
-        self.start_sound = start_sound
-        self.choice = choice
+    cue: str
+    text: str = None
+    delay: float = 0
+    start_sound: str = None
+    choice: str = None
 
-    @staticmethod
-    def from_data(data, external_delay=0, choice=None):
+    @classmethod
+    def from_data(cls, data, external_delay=0, choice=None):
         """
         Loads ourselves from data from the Lua/JSON.  The cue might have
         a `choice` associated with it, and there might have been an initial
         delay defined "above" this level.  Can raise `NotACueException`
         if no actual cue is found.
         """
+        # Local bindings beat LOAD_GLOBAL lookups in a function that runs
+        # once per cue across the whole dataset
+        vo_match = _vo_match
+        intern = sys.intern
         cue = None
         text = None
         delay = 0
@@ -122,8 +251,12 @@ class Cue:
             if data['Cue'] == '':
                 # Bouldy, in particular, includes a blank `Cue`
                 cue = ''
-            elif match := VO.vo_re.match(data['Cue']):
-                cue = match.group('cue')
+            elif match := vo_match(data['Cue']):
+                # The same VO IDs (and choice labels, below) show up over and
+                # over across thousands of cues; interning lets all those
+                # copies share storage, and makes later dict lookups able to
+                # short-circuit on identity.
+                cue = intern(match.group('cue'))
             else:
                 print('WARNING: Cue without match: {}'.format(data['Cue']))
         if cue is None:
@@ -136,8 +269,8 @@ class Cue:
             # TODO: Should maybe try and support this, though the two that I've
             # seen thus far (CerberusWhine and CerberusWhineSad) aren't actually
             # extracted properly, so it sort of doesn't matter yet.
-            if match := VO.vo_re.match(data['StartSound']):
-                start_sound = match.group('cue')
+            if match := vo_match(data['StartSound']):
+                start_sound = intern(match.group('cue'))
             else:
                 if data['StartSound'].startswith('/SFX/'):
                     # Special-case here; we do see various /SFX/* sounds, like /SFX/DusaRattle
@@ -148,7 +281,9 @@ class Cue:
                 else:
                     print('WARNING: Cue without match: {}'.format(data['StartSound']))
         delay += external_delay
-        return Cue(cue,
+        if choice is not None:
+            choice = intern(choice)
+        return cls(cue,
                 text=text,
                 delay=delay,
                 start_sound=start_sound,
@@ -180,7 +315,9 @@ class VO:
     of dialogue in the game.
     """
 
-    vo_re = re.compile(r'^/VO/(?P<cue>\S+)$')
+    __slots__ = ('file_map', 'label', 'config', 'cues')
+
+    vo_re = _vo_re
 
     def __init__(self, data, file_map, config, label=None):
         """
@@ -193,18 +330,38 @@ class VO:
         #print(f' - {label}')
 
         self.cues = []
+        self._parse(data)
+
+        if len(self.cues) == 0:
+            raise NoCuesException()
+
+        # If there's a delay on the very first cue, ignore it
+        if self.cues[0].delay:
+            self.cues[0] = dataclasses.replace(self.cues[0], delay=0)
+
+    def _parse(self, data):
+        """
+        Parse a single node of voiceover data, appending Cues onto
+        `self.cues`.  Nested nodes (Choices / EndVoiceLines) recurse via
+        `_parse_child` -- we used to construct throwaway child VO objects
+        just to harvest their `cues` lists, which re-ran the whole
+        constructor per node for nothing.
+        """
+
+        # Local binding; this runs once per node across the whole dataset
+        vo_match = _vo_match
 
         # In very basic voiceovers, this might just be a list of cues.  Much more
         # commonly it's a dict with a bunch of other params, and we have to do some
         # funky dict-pretending-to-be-a-list thing.
-        if type(data) == list:
+        if data.__class__ is list:
             # This is the most basic setup.  See NPC_Bouldy_01/BouldyGiftRepeatable01, for instance
             for cue_data in data:
                 try:
                     self.cues.append(Cue.from_data(cue_data))
                 except NotACueException:
                     pass
-        elif type(data) == dict:
+        elif data.__class__ is dict:
             # This is far more common -- we have various other dict entries
 
             # Check to see if there's an initial delay
@@ -221,33 +378,34 @@ class VO:
             else:
                 choice_text = None
 
-            # Loop through all the numeric indexes (this is the dict-pretending-to-be-a-list)
-            for num in range(len(data.keys())):
-                num_str = str(num)
-                if num_str in data:
-                    if type(data[num_str]) == dict \
-                            and 'Choices' in data[num_str] \
-                            and type(data[num_str]['Choices']) == list:
-                        for choice_data in data[num_str]['Choices']:
-                            try:
-                                # We're technically losing initial_delay here.  Whatever.
-                                # (also, nested choices might act weird, but there aren't any
-                                # of those, so also Whatever.)
-                                choice_vo = VO(choice_data, file_map, self.config)
-                                self.cues.extend(choice_vo.cues)
-                            except NoCuesException:
-                                pass
-                    else:
-                        try:
-                            self.cues.append(Cue.from_data(data[num_str], external_delay=initial_delay, choice=choice_text))
-                            initial_delay = 0
-                        except NotACueException:
-                            pass
+            # Loop through all the numeric indexes (this is the dict-pretending-
+            # to-be-a-list).  A single pass over items() beats probing the dict
+            # with a freshly-built `str(num)` per index, and also handles sparse
+            # numbering, which the old range() scan would've silently skipped.
+            numeric_items = sorted(
+                    ((int(key), value) for key, value in data.items() if key.isdigit()),
+                    key=lambda kv: kv[0],
+                    )
+            for _, entry in numeric_items:
+                if entry.__class__ is dict \
+                        and 'Choices' in entry \
+                        and entry['Choices'].__class__ is list:
+                    for choice_data in entry['Choices']:
+                        # We're technically losing initial_delay here.  Whatever.
+                        # (also, nested choices might act weird, but there aren't any
+                        # of those, so also Whatever.)
+                        self._parse_child(choice_data)
+                else:
+                    try:
+                        self.cues.append(Cue.from_data(entry, external_delay=initial_delay, choice=choice_text))
+                        initial_delay = 0
+                    except NotACueException:
+                        pass
 
             # Add EndCue, if we have it
             end_cue = None
             if 'EndCue' in data and data['EndCue'] is not None:
-                if match := VO.vo_re.match(data['EndCue']):
+                if match := vo_match(data['EndCue']):
                     if 'EndWait' in data and data['EndWait'] is not None:
                         end_delay = float(data['EndWait'])
                     else:
@@ -259,28 +417,26 @@ class VO:
             # Then EndVoiceLines is less-formal dialogue out in the main game world
             # (you've got control at this point)
             if 'EndVoiceLines' in data:
-                if type(data['EndVoiceLines']) == dict:
-                    try:
-                        other_vo = VO(data['EndVoiceLines'], file_map, self.config)
-                        self.cues.extend(other_vo.cues)
-                    except NoCuesException:
-                        pass
-                elif type(data['EndVoiceLines']) == list:
+                if data['EndVoiceLines'].__class__ is dict:
+                    self._parse_child(data['EndVoiceLines'])
+                elif data['EndVoiceLines'].__class__ is list:
                     # Seems like these just get played one after the other
                     for sub_data in data['EndVoiceLines']:
-                        try:
-                            other_vo = VO(sub_data, file_map, self.config)
-                            self.cues.extend(other_vo.cues)
-                        except NoCuesException:
-                            pass
+                        self._parse_child(sub_data)
         else:
             print('WARNING: Unknown data type for voiceovers: {}'.format(type(data)))
 
-        if len(self.cues) == 0:
-            raise NoCuesException()
-
-        # If there's a delay on the very first cue, ignore it
-        self.cues[0].delay = 0
+    def _parse_child(self, data):
+        """
+        Parse a nested node of voiceover data.  Mirrors the old
+        child-VO behavior: a node which yields no cues is silently
+        ignored, and the first cue a node *does* yield gets its delay
+        zeroed (as the child VO constructor used to do).
+        """
+        start = len(self.cues)
+        self._parse(data)
+        if len(self.cues) > start and self.cues[start].delay:
+            self.cues[start] = dataclasses.replace(self.cues[start], delay=0)
 
     def play(self, do_prompt=False):
         """
@@ -294,25 +450,34 @@ class VO:
         else:
             print('(no label)')
             print('----------')
+        # Figure out where the filename goes in the player command once per
+        # VO, rather than re-scanning (and re-copying) the list per cue.
+        base_cmd = self.config.media_player_list
+        try:
+            brace_idx = base_cmd.index('{}')
+        except ValueError:
+            brace_idx = None
         for cue in self.cues:
             print(f'  -> {cue.label()}')
             if cue.text is not None:
-                for line in textwrap.wrap(cue.text,
-                        initial_indent='     ',
-                        subsequent_indent='     ',
-                        ):
+                for line in _wrapper.wrap(cue.text):
                     print(line)
             if cue.delay > 0:
                 time.sleep(cue.delay)
             if cue.cue != '':
                 if cue.cue in self.file_map:
-                    command = list(self.config.media_player_list)
-                    try:
-                        brace_idx = command.index('{}')
-                        command[brace_idx] = self.file_map[cue.cue]
-                    except ValueError:
-                        command.append(self.file_map[cue.cue])
-                    subprocess.run(command, capture_output=True)
+                    filename = self.file_map[cue.cue]
+                    if brace_idx is None:
+                        command = base_cmd + [filename]
+                    else:
+                        command = base_cmd[:brace_idx] + [filename] + base_cmd[brace_idx+1:]
+                    # We never look at the player's output; DEVNULL skips the
+                    # pipe setup + parent-side buffering that capture_output
+                    # was paying for on every line.
+                    subprocess.run(command,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL,
+                            )
                 else:
                     print(f'     ERROR: {cue.cue} not found')
             print('')
@@ -339,8 +504,18 @@ class Bank:
 
     Acts as both an iterable and as a dict, to provide easy access to
     the various voiceovers.
+
+    VO construction is lazy -- the constructor just stashes the raw data,
+    and the actual VO/Cue objects get built the first time anyone asks
+    for this bank's contents.  A typical run only plays dialogue from a
+    single character, so most banks never need to be built at all.
+
+    Note that subclasses declare `__slots__` as well (required for the
+    memory savings to actually kick in).
     """
 
+    __slots__ = ('name', 'file_map', 'config', 'combined', '_raw', '_loaded', '_groups')
+
     def __init__(self, name, file_map, config, data):
         """
         Can raise `NoVOsException` if no voiceovers were found.
@@ -349,11 +524,30 @@ class Bank:
         self.file_map = file_map
         self.config = config
         self.combined = {}
-        for key, label, obj in self.groups:
-            if key in data and type(data[key]) == dict:
-                for label, lineset in data[key].items():
+        self._raw = data
+        self._loaded = False
+
+        # Cheap up-front check so that Registry can still filter out chars
+        # with no dialogue at all.  (Note that this is slightly looser than
+        # it used to be -- a char whose linesets all turn out to be cueless
+        # will now show up with zero playable VOs rather than being culled.)
+        if not any([key in data and data[key].__class__ is dict and len(data[key]) > 0
+                for key, _, _ in self._groups]):
+            raise NoVOsException()
+
+    def _load(self):
+        """
+        Build all of our VO objects from the raw data, if we haven't
+        done so already.
+        """
+        if self._loaded:
+            return
+        self._loaded = True
+        for key, label, obj in self._groups:
+            if key in self._raw and self._raw[key].__class__ is dict:
+                for label, lineset in self._raw[key].items():
                     try:
-                        obj[label] = VO(lineset, file_map, config, label)
+                        obj[label] = VO(lineset, self.file_map, self.config, label)
                         if label in self.combined:
                             # HermesPostEnding01 is our single known instance of this.
                             # Exists in SuperPriorityPickupTextLineSets and in
@@ -367,18 +561,23 @@ class Bank:
                     except NoCuesException:
                         pass
 
-        if all([len(d) == 0 for d in [g[2] for g in self.groups]]):
-            raise NoVOsException()
+    @property
+    def groups(self):
+        self._load()
+        return self._groups
 
     def __iter__(self):
-        for _, _, group in self.groups:
+        self._load()
+        for _, _, group in self._groups:
             for val in group.values():
                 yield val
 
     def __contains__(self, key):
+        self._load()
         return key in self.combined
 
     def __getitem__(self, key):
+        self._load()
         return self.combined[key]
 
 class NPCBank(Bank):
@@ -386,11 +585,13 @@ class NPCBank(Bank):
     Stores voiceovers for NPCs
     """
 
+    __slots__ = ('interacts', 'repeatables', 'gifts')
+
     def __init__(self, name, file_map, config, data):
         self.interacts = {}
         self.repeatables = {}
         self.gifts = {}
-        self.groups = [
+        self._groups = [
                 ('InteractTextLineSets', 'Interacts', self.interacts),
                 ('RepeatableTextLineSets', 'Repeatables', self.repeatables),
                 ('GiftTextLineSets', 'Gifts', self.gifts),
@@ -403,13 +604,15 @@ class EnemyBank(Bank):
     Thanatos, when encountered in the wild).
     """
 
+    __slots__ = ('supers', 'priorities', 'intros', 'basics', 'repeatables')
+
     def __init__(self, name, file_map, config, data):
         self.supers = {}
         self.priorities = {}
         self.intros = {}
         self.basics = {}
         self.repeatables = {}
-        self.groups = [
+        self._groups = [
                 ('BossPresentationIntroTextLineSets', 'Intros', self.intros),
                 ('BossPresentationTextLineSets', 'Basic Conversations', self.basics),
                 ('BossPresentationPriorityIntroTextLineSets', 'Priorities', self.priorities),
@@ -423,6 +626,8 @@ class LootBank(Bank):
     Stores voiceovers for Loot/Boons -- ie: Olympian gods (plus Chaos)
     """
 
+    __slots__ = ('duos', 'supers', 'priorities', 'pickups', 'boughts', 'rejections', 'makeups', 'gifts')
+
     def __init__(self, name, file_map, config, data):
         self.duos = {}
         self.supers = {}
@@ -432,7 +637,7 @@ class LootBank(Bank):
         self.rejections = {}
         self.makeups = {}
         self.gifts = {}
-        self.groups = [
+        self._groups = [
                 ('PickupTextLineSets', 'Pickups', self.pickups),
                 ('DuoPickupTextLineSets', 'Duos', self.duos),
                 ('BoughtTextLines', 'Bought', self.boughts),
@@ -485,8 +690,21 @@ class Dialogue:
     Registry objects for NPCs+Enemies+Loot, which in turn hold Bank objects to hold
     each char, which in turn hold VO objects for each voiceover, which in turn
     hold one or more Cue objects.
+
+    The registries themselves are cached properties -- most runs only ever
+    touch one of the three categories, so there's no point decoding the
+    other two caches.  The underlying cache files get memoized separately,
+    since the NPC and Enemy registries each need a couple of crossover
+    entries from the other one's file.
     """
 
+    # The handful of known cross-registered characters: EnemyData contains
+    # one NPC-style entry (Skelly/TrainingMelee), and NPCData contains a
+    # couple of enemy-style entries (Cerberus + Thanatos).  We used to
+    # re-parse the *entire* opposite-side dict just to dig these out.
+    npc_crossover_names = {'TrainingMelee'}
+    enemy_crossover_names = {'NPC_Cerberus_01', 'NPC_Thanatos_01'}
+
     def __init__(self, config):
 
         self.config = config
@@ -503,76 +721,141 @@ class Dialogue:
         config.enemydata_json = self._get_json_cache(config.enemydata_script)
         config.lootdata_json = self._get_json_cache(config.lootdata_script)
 
-        # Read npcdata json and create NPC registry
-        with lzma.open(config.npcdata_json) as df:
-            npcdata = json.load(df)
-        self.npc = Registry(NPCBank, self.oggs, self.config, npcdata['.NPCs'])
-
-        # Read enemydata json and create enemy registry
-        with lzma.open(config.enemydata_json) as df:
-            enemydata = json.load(df)
-        self.enemy = Registry(EnemyBank, self.oggs, self.config, enemydata['.Enemies'])
+        # Memoized raw cache data; see _load_raw
+        self._raw_data = {}
 
+    def _load_raw(self, *cache_files):
+        """
+        Load (and memoize) the given cache files, returning their data in
+        order.  When more than one un-memoized file is needed at once,
+        the loads run in a thread pool -- decompression happens in C code
+        which drops the GIL, so they genuinely overlap on multi-core.
+        """
+        missing = [f for f in cache_files if f not in self._raw_data]
+        if len(missing) == 1:
+            self._raw_data[missing[0]] = self._load_cache(missing[0])
+        elif missing:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                for cache_file, data in zip(missing, executor.map(self._load_cache, missing)):
+                    self._raw_data[cache_file] = data
+        return [self._raw_data[f] for f in cache_files]
+
+    @functools.cached_property
+    def npc(self):
+        """
+        The NPC registry; built on first access
+        """
+        npcdata, enemydata = self._load_raw(self.config.npcdata_json, self.config.enemydata_json)
+        registry = Registry(NPCBank, self.oggs, self.config, npcdata['.NPCs'])
         # Our enemy data also includes one that's actually an NPC (Skelly/TrainingMelee)
-        self.npc.copyfrom(Registry(NPCBank, self.oggs, self.config, enemydata['.Enemies']))
-
-        # ... and our NPC data includes a few that enemy-style entries, too (Cerberus + Thanatos)
-        self.enemy.copyfrom(Registry(EnemyBank, self.oggs, self.config, npcdata['.NPCs']))
+        registry.copyfrom(Registry(NPCBank, self.oggs, self.config,
+            {name: enemydata['.Enemies'][name]
+                for name in self.npc_crossover_names
+                if name in enemydata['.Enemies']}))
+        return registry
+
+    @functools.cached_property
+    def enemy(self):
+        """
+        The Enemy registry; built on first access
+        """
+        npcdata, enemydata = self._load_raw(self.config.npcdata_json, self.config.enemydata_json)
+        registry = Registry(EnemyBank, self.oggs, self.config, enemydata['.Enemies'])
+        # Our NPC data includes a few enemy-style entries, too (Cerberus + Thanatos)
+        registry.copyfrom(Registry(EnemyBank, self.oggs, self.config,
+            {name: npcdata['.NPCs'][name]
+                for name in self.enemy_crossover_names
+                if name in npcdata['.NPCs']}))
+        return registry
+
+    @functools.cached_property
+    def loot(self):
+        """
+        The Loot registry; built on first access
+        """
+        lootdata, = self._load_raw(self.config.lootdata_json)
+        return Registry(LootBank, self.oggs, self.config, lootdata['LootData'])
 
-        # Read lootdata json and create loot registry
-        with lzma.open(config.lootdata_json) as df:
-            lootdata = json.load(df)
-        self.loot = Registry(LootBank, self.oggs, self.config, lootdata['LootData'])
+    def _load_cache(self, cache_file):
+        """
+        Load one of our compressed caches.  New-style caches are pickles,
+        which skip JSON's string-unescaping and number-reparsing entirely.
+        For legacy JSON caches: if `ijson` is available we stream-parse
+        the top-level keys, which overlaps decompression with parsing and
+        avoids holding the whole decoded document in memory at once.  (We
+        can't use ijson's prefix addressing to pull out just the subtree
+        we want, since our top-level keys contain dots.)  Otherwise, fall
+        back to a plain `json.load`.
+        """
+        with _open_cache(cache_file, 'rb') as df:
+            if cache_file.endswith(('.pkl.zst', '.pkl.xz')):
+                return pickle.load(df)
+            if ijson is not None:
+                return dict(ijson.kvitems(df, ''))
+            # Without ijson, slurp the whole decompressed stream in one
+            # go -- json.loads on a single bytes object skips the
+            # per-buffer read dispatch that json.load does, and these
+            # files comfortably fit in RAM.
+            return json.loads(df.read())
 
     def _get_json_cache(self, script_filename):
         """
-        Convert a given Lua script to JSON, for easier processing
+        Convert a given Lua script to a pickled data cache, for easier
+        (and much faster) processing.  The cache's only consumer is our
+        own `_load_cache`, so there's no reason to pay JSON encode/decode
+        costs on a tree that never leaves this program.
         """
         script_base = script_filename.rsplit('.', 1)[0]
-        json_file = os.path.join(self.config.cache_dir, f'{script_base}.json.xz')
-        if self.config.rebuild_cache or not os.path.exists(json_file):
+        if zstandard is not None:
+            cache_file = os.path.join(self.config.cache_dir, f'{script_base}.pkl.zst')
+        else:
+            cache_file = os.path.join(self.config.cache_dir, f'{script_base}.pkl.xz')
+        if self.config.rebuild_cache or not os.path.exists(cache_file):
+            # If we've got an older-format cache lying around, keep using
+            # it rather than re-parsing the Lua from scratch.
+            if not self.config.rebuild_cache:
+                for legacy_ext in ('pkl.xz', 'json.zst', 'json.xz'):
+                    legacy_file = os.path.join(self.config.cache_dir, f'{script_base}.{legacy_ext}')
+                    if legacy_file != cache_file and os.path.exists(legacy_file):
+                        return legacy_file
             orig_file = os.path.join(self.config.lua_dir, script_filename)
-            print(f'NOTICE: Converting {orig_file} to {json_file}')
+            print(f'NOTICE: Converting {orig_file} to {cache_file}')
 
             # SLPP doesn't really like these files as-is.  We need to wrap the
             # whole file in curly braces (so it's one big dict) and add commas
             # inbetween the various elements. This is far from a
             # general-purpose solution but it works well for us.  We're doing
             # some shenanigans with `injecting_comma` so that we don't put one
-            # after the *final* dict closure, by accident.
-            lua = io.StringIO()
+            # after the *final* dict closure, by accident.  Accumulate into a
+            # list and join once at the end -- print()-per-line into a StringIO
+            # was a surprising amount of overhead on these multi-thousand-line
+            # files.
+            parts = ['{\n']
             with open(orig_file, 'rt', encoding='utf-8') as df:
                 injecting_comma = False
-                print('{', file=lua)
                 for line in df:
                     if injecting_comma:
-                        print(',', file=lua)
+                        parts.append(',\n')
                         injecting_comma = False
-                    rstripped = line.rstrip()
-                    if rstripped == '}':
+                    if line.rstrip() == '}':
                         injecting_comma = True
-                        lua.write(line)
-                    # Used to trim these lines out but it turns out it's not necessary
-                    #elif rstripped == 'OverwriteTableKeys( EnemyData, UnitSetData.NPCs )':
-                    #    pass
-                    #elif rstripped == 'GlobalVoiceLines = GlobalVoiceLines or {}':
-                    #    pass
-                    else:
-                        lua.write(line)
-                print('}', file=lua)
-            lua.seek(0)
+                    # Used to trim out the `OverwriteTableKeys(...)` and
+                    # `GlobalVoiceLines = ...` lines here, but it turns out
+                    # it's not necessary
+                    parts.append(line)
+            parts.append('}\n')
+            lua_str = ''.join(parts)
 
             # temp -- write out
             #with open(os.path.join(self.config.cache_dir, f'{script_base}-edited.lua'), 'wt', encoding='utf-8') as odf:
-            #    odf.write(lua.read())
-            #lua.seek(0)
+            #    odf.write(lua_str)
 
-            # Convert to JSON
-            data = slpp.slpp.decode(lua.read())
-            with lzma.open(json_file, 'wt', encoding='utf-8') as odf:
-                json.dump(data, odf, indent=2)
+            # Parse and pickle
+            data = _decode_lua(lua_str)
+            with _open_cache(cache_file, 'wb') as odf:
+                pickle.dump(data, odf, protocol=pickle.HIGHEST_PROTOCOL)
 
-        return json_file
+        return cache_file
 
 class BaseConfig(argparse.Namespace):
     """
@@ -603,10 +886,9 @@ class BaseConfig(argparse.Namespace):
     def __init__(self):
         self._saved_sections = {}
         if os.path.exists(self.config_file):
-            cp = configparser.ConfigParser()
-            cp.read(self.config_file)
+            cp = self._load_config_parser()
+            known_sections = {'main'}
             if 'main' in cp:
-                known_sections = {'main'}
                 if 'ogg_dir' in cp['main']:
                     self.ogg_dir = cp['main']['ogg_dir']
                 else:
@@ -647,6 +929,40 @@ class BaseConfig(argparse.Namespace):
                 if section not in known_sections:
                     self._saved_sections[section] = cp[section]
 
+    def _load_config_parser(self):
+        """
+        Returns a ConfigParser for our config file, going through a
+        little pickled cache when possible.  Even a small INI costs a
+        millisecond or two of ConfigParser parsing on every launch,
+        whereas a stat plus a pickle.load is effectively free.  The
+        cache is keyed on the INI's mtime+size, so hand-editing the
+        file (or save() rewriting it) invalidates it automatically.
+        The cache always lives in our default appdirs cache dir, since
+        at this point we haven't read any `cache_dir` override yet.
+        """
+        st = os.stat(self.config_file)
+        file_key = (st.st_mtime_ns, st.st_size)
+        cache_file = os.path.join(BaseConfig.cache_dir, 'config.pkl')
+        try:
+            with open(cache_file, 'rb') as df:
+                cached_key, sections = pickle.load(df)
+            if cached_key == file_key:
+                cp = configparser.ConfigParser()
+                cp.read_dict(sections)
+                return cp
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            pass
+        cp = configparser.ConfigParser()
+        cp.read(self.config_file)
+        sections = {section: dict(cp[section]) for section in cp.sections()}
+        try:
+            os.makedirs(BaseConfig.cache_dir, exist_ok=True)
+            with open(cache_file, 'wb') as odf:
+                pickle.dump((file_key, sections), odf, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+        return cp
+
     def _read_extra_config(self, cp):
         """
         Implement if necessary!  Returns a set containing the names
@@ -786,10 +1102,21 @@ class BaseApp:
         # Read in all our Dialogue data
         self.dialogue = Dialogue(self.config)
 
-        # Some convenience vars
-        self.npc = self.dialogue.npc
-        self.enemy = self.dialogue.enemy
-        self.loot = self.dialogue.loot
+    # Some convenience accessors.  These are properties rather than plain
+    # vars so that merely instantiating the app doesn't force all three
+    # registries to load.
+
+    @property
+    def npc(self):
+        return self.dialogue.npc
+
+    @property
+    def enemy(self):
+        return self.dialogue.enemy
+
+    @property
+    def loot(self):
+        return self.dialogue.loot
 
     def _extra_args(self, parser):
         """
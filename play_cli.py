@@ -26,6 +26,8 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import sys
+
 from hdialogue.hdialogue import BaseApp, BaseConfig
 
 class Config(BaseConfig):
@@ -102,9 +104,9 @@ class App(BaseApp):
 
             # Play specific dialogues
             else:
-                if specific_notes and self.config.which in specific_notes:
-                    for line in specific_notes[self.config.which]:
-                        print(line)
+                note = specific_notes.get(self.config.which) if specific_notes else None
+                if note:
+                    sys.stdout.write(note + '\n')
                 registry[choice][self.config.which].play()
         else:
             # Play all dialogues
@@ -128,29 +130,24 @@ class App(BaseApp):
         elif self.config.loot:
             self.play_registry(self.loot, self.config.loot,
                     specific_notes={
-                        'HermesPostEnding01': [
-                            'WARNING: HermesPostEnding01 appears under two separate voiceover',
+                        'HermesPostEnding01':
+                            'WARNING: HermesPostEnding01 appears under two separate voiceover\n'
                             'categories.  Only one of them can be played using -w/--which',
-                            ],
                         })
 
-        # Show IDs
+        # Show IDs.  One stdout write per category, rather than a print()
+        # call (and write syscall) per name.
         elif self.config.show:
-            print('NPCs')
-            print('----')
-            for name in sorted(self.npc.keys()):
-                print(name)
-            print('')
-            print('Enemies')
-            print('-------')
-            for name in sorted(self.enemy.keys()):
-                print(name)
-            print('')
-            print('Loot')
-            print('----')
-            for name in sorted(self.loot.keys()):
-                print(name)
-            print('')
+            for header, registry in [
+                    ('NPCs', self.npc),
+                    ('Enemies', self.enemy),
+                    ('Loot', self.loot),
+                    ]:
+                sys.stdout.write('{}\n{}\n{}\n\n'.format(
+                    header,
+                    '-'*len(header),
+                    '\n'.join(sorted(registry.keys())),
+                    ))
 
         # Magic!
         elif self.config.magic:
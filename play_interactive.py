@@ -28,32 +28,23 @@
 
 import os
 import sys
-import math
 import enum
-import appdirs
-import itertools
-import inputimeout
-
-from rich import print, get_console
-from rich.console import Console
-from rich.theme import Theme
-from rich.table import Table
 
 from hdialogue.hdialogue import BaseApp, BaseConfig
 
-def column_chunks(l, columns):
-    """
-    Divide up a given list `l` into the specified number of
-    `columns`.  Yields each column in turn, as a list.  (Does
-    *not* do any padding.)
-    """
-    length = len(l)
-    if length == 0:
-        yield []
-    else:
-        n = math.ceil(length/columns)
-        for i in range(0, length, n):
-            yield l[i:i + n]
+# Note that the heavier third-party imports (rich, appdirs) are deferred
+# to the spots that actually use them, so that `-h` output and argparse
+# errors don't have to pay for them.
+
+# Parsed user-theme cache -- stat+parse the theme file at most once per
+# process, no matter how many Apps get instantiated (see App.__init__)
+_cached_theme = None
+_theme_loaded = False
+
+# Breadcrumb-label template for voiceover options ("(3/17) SomeCue"); %
+# formatting is a hair faster than .format() when stamping out hundreds
+# of these per bank
+_cue_label = '([dim cyan]%d[/dim cyan]/[dim cyan]%d[/dim cyan]) %s'
 
 class Config(BaseConfig):
     """
@@ -68,17 +59,23 @@ class Config(BaseConfig):
         """
         Extra config to read from our file
         """
-        if 'play_interactive' in cp:
-            try:
-                self.columns = int(cp['play_interactive']['columns'])
-            except (ValueError, KeyError):
-                self.save_config = True
-            try:
-                self.min_rows = int(cp['play_interactive']['min_rows'])
-            except (ValueError, KeyError):
-                self.save_config = True
-        else:
+        section = cp['play_interactive'] if 'play_interactive' in cp else None
+        if section is None:
             self.save_config = True
+        else:
+            def get_int(key, default):
+                # A single .get() per key, and no KeyError gets constructed
+                # on the miss path (the common case on a first run)
+                value = section.get(key)
+                if value is not None:
+                    try:
+                        return int(value)
+                    except ValueError:
+                        pass
+                self.save_config = True
+                return default
+            self.columns = get_int('columns', self.columns)
+            self.min_rows = get_int('min_rows', self.min_rows)
         return {'play_interactive'}
 
     def _write_extra_config(self, cp):
@@ -92,22 +89,33 @@ class Config(BaseConfig):
 
 class Breadcrumb:
     """
-    Helper to keep track of where we are in the object structure
+    Helper to keep track of where we are in the object structure.  Holds
+    the full tuple of sibling Options plus an integer cursor, so that
+    next/prev/autoplay navigation is just cursor arithmetic (the option
+    tuples themselves are immutable and shared).
     """
 
-    def __init__(self, option, prev_options):
-        self.option = option
-        self.prev_options = prev_options
+    __slots__ = ('options', 'cursor')
+
+    def __init__(self, options, cursor):
+        self.options = options
+        self.cursor = cursor
+
+    @property
+    def option(self):
+        return self.options[self.cursor]
 
 class Option:
     """
-    A single option for the user
+    A single option for the user.  (Its position in the menu is implied
+    by its index in the containing tuple.)
     """
 
-    def __init__(self, label, data, pos, breadcrumb_label=None):
+    __slots__ = ('label', 'data', 'breadcrumb_label')
+
+    def __init__(self, label, data, breadcrumb_label=None):
         self.label = label
         self.data = data
-        self.pos = pos
         if breadcrumb_label is None:
             self.breadcrumb_label = label
         else:
@@ -115,12 +123,15 @@ class Option:
 
 class Result(enum.Enum):
     """
-    The result of processing user input, if any (the routine which handles
-    user input might return None as well)
+    The result of processing user input.  process_options returns a
+    (Result, payload) tuple; the payload is the popped Breadcrumb for
+    BREADCRUMB, the chosen Option for OPTION, and None otherwise.
     """
     PLAY = enum.auto()
     AUTOPLAY = enum.auto()
     AUTOPLAY_ALL = enum.auto()
+    BREADCRUMB = enum.auto()
+    OPTION = enum.auto()
 
 class App(BaseApp):
     """
@@ -133,13 +144,32 @@ class App(BaseApp):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        # Option-list cache for run(), and rendered-table cache for
+        # _build_options_table; see those for details
+        self._options_cache = {}
+        self._table_cache = {}
+
+        # The top-level menu never changes, so build it just once
+        self._root_options = (
+                Option('NPCs', self.npc),
+                Option('Enemies', self.enemy),
+                Option('Loot', self.loot),
+                )
+
         # Colorization tweaks, if present
-        config_dir = appdirs.user_config_dir('py-rich', 'apocalyptech')
-        rich_theme = os.path.join(config_dir, 'apoc.theme')
-        if os.path.exists(rich_theme):
-            t = Theme().read(rich_theme)
-            get_console().push_theme(t)
-            #print(t.styles)
+        global _cached_theme, _theme_loaded
+        if not _theme_loaded:
+            _theme_loaded = True
+            import appdirs
+            config_dir = appdirs.user_config_dir('py-rich', 'apocalyptech')
+            rich_theme = os.path.join(config_dir, 'apoc.theme')
+            if os.path.exists(rich_theme):
+                from rich.theme import Theme
+                _cached_theme = Theme().read(rich_theme)
+                #print(_cached_theme.styles)
+        if _cached_theme is not None:
+            from rich import get_console
+            get_console().push_theme(_cached_theme)
 
     def _extra_args(self, parser):
         """
@@ -158,9 +188,72 @@ class App(BaseApp):
                 help='Minimum rows before columns get used',
                 )
 
+    def _build_options_table(self, options):
+        """
+        Build (and memoize) the rich Table for a given options list.  The
+        prompt gets redrawn constantly -- on every replay/next/autoplay
+        step -- so there's no sense reconstructing an identical table
+        each time.  Keyed on id(); the non-empty option lists all live
+        forever in run()'s options cache, so the ids are stable.  (Empty
+        lists are transient, so those stay unmemoized -- their tables are
+        trivial anyway.)
+        """
+        table = self._table_cache.get(id(options))
+        if table is not None:
+            return table
+
+        from rich.table import Table
+
+        table = Table(
+                show_header=False,
+                box=None,
+                highlight=True,
+                pad_edge=False,
+                )
+        length = len(options)
+        num_columns = 1
+        table.add_column()
+        while num_columns < self.config.columns:
+            if length/num_columns > self.config.min_rows:
+                table.add_column()
+                num_columns += 1
+            else:
+                break
+        # Straight index math per row -- no generator/zip_longest overhead.
+        # (The double negation is just an integer ceiling-divide.)
+        n = -(-length // num_columns)
+        for row in range(n):
+            table.add_row(*[
+                    f'{col*n+row+1}) {options[col*n+row].label}'
+                        if col*n+row < length else ''
+                    for col in range(num_columns)
+                    ])
+        if length > 0:
+            self._table_cache[id(options)] = table
+        return table
+
+    def _wait_for_enter(self, prompt, timeout):
+        """
+        Show `prompt` and wait up to `timeout` seconds for the user to
+        hit Enter; returns True if they did.  A single select() call
+        gives us the timeout directly, rather than the polling loop that
+        the old inputimeout dependency used.  (POSIX-only, but so is the
+        rest of my tooling.)
+        """
+        import select
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        rlist, _, _ = select.select([sys.stdin], [], [], timeout)
+        if rlist:
+            sys.stdin.readline()
+            return True
+        sys.stdout.write('\n')
+        return False
+
     def error(self, text):
+        from rich import print
         print(f'[bold red]{text}[/bold red]')
-        print('')
+        sys.stdout.write('\n')
 
     def process_options(self, options, stack, playing=True):
         """
@@ -178,8 +271,10 @@ class App(BaseApp):
         etc.  So, I never bothered making this more general-purpose.
         """
 
+        from rich import print
+
         if len(stack) == 4:
-            num_options = len(stack[-1].prev_options)
+            num_options = len(stack[-1].options)
         else:
             num_options = len(options)
         allow_prev = False
@@ -188,8 +283,8 @@ class App(BaseApp):
         allow_autoplay = False
         if playing:
             allow_replay = True
-            cur_pos = stack[-1].option.pos
-            playlist_len = len(stack[-1].prev_options)
+            cur_pos = stack[-1].cursor
+            playlist_len = len(stack[-1].options)
             if cur_pos > 0:
                 allow_prev = True
             if cur_pos < (playlist_len-1):
@@ -213,61 +308,40 @@ class App(BaseApp):
         prompts.append('[q]uit')
         prompt_txt = ', '.join(prompts) + '> '
 
-        # Construct options table
-        table = Table(
-                show_header=False,
-                box=None,
-                highlight=True,
-                pad_edge=False,
-                )
-        num_columns = 1
-        table.add_column()
-        while num_columns < self.config.columns:
-            if num_options/num_columns > self.config.min_rows:
-                table.add_column()
-                num_columns += 1
-            else:
-                break
-        for row_data in itertools.zip_longest(*column_chunks(options, num_columns)):
-            new_row = []
-            for item in row_data:
-                if item is None:
-                    new_row.append('')
-                else:
-                    new_row.append(f'{item.pos+1}) {item.label}')
-            table.add_row(*new_row)
+        # Grab our options table (memoized)
+        table = self._build_options_table(options)
 
         while True:
-            #for option in options:
-            #    print(f'{option.pos+1}) {option.label}')
+            #for num, option in enumerate(options):
+            #    print(f'{num+1}) {option.label}')
             print(table)
-            print('')
+            sys.stdout.write('\n')
             resp = input(prompt_txt)
             resp = resp.strip().lower()
-            print('')
+            sys.stdout.write('\n')
             if resp == 'q':
                 sys.exit(0)
             elif len(stack) > 0 and resp == 'b':
-                return stack.pop()
+                return Result.BREADCRUMB, stack.pop()
             elif allow_replay and resp == 'r':
-                return Result.PLAY
+                return Result.PLAY, None
             elif allow_prev and resp == 'p':
-                stack[-1].option = stack[-1].prev_options[cur_pos-1]
-                return Result.PLAY
+                stack[-1].cursor -= 1
+                return Result.PLAY, None
             elif allow_next and resp == 'n':
-                stack[-1].option = stack[-1].prev_options[cur_pos+1]
-                return Result.PLAY
+                stack[-1].cursor += 1
+                return Result.PLAY, None
             elif allow_autoplay and resp == 'a':
                 if len(stack) == 3:
                     # We're at the list of options, so advance into there
                     # and start playing
-                    stack.append(Breadcrumb(options[0], options))
-                    return Result.AUTOPLAY_ALL
+                    stack.append(Breadcrumb(options, 0))
+                    return Result.AUTOPLAY_ALL, None
                 else:
                     # Already "at" an existing entry.  Advance the playlist,
                     # since we'll have already heard this one
-                    stack[-1].option = stack[-1].prev_options[cur_pos+1]
-                    return Result.AUTOPLAY
+                    stack[-1].cursor += 1
+                    return Result.AUTOPLAY, None
             elif num_options > 0:
                 try:
                     intval = int(resp)
@@ -278,11 +352,11 @@ class App(BaseApp):
                     self.error(f'Number must be from 1 to {num_options}')
                     continue
                 if len(stack) == 4:
-                    stack[-1].option = stack[-1].prev_options[intval-1]
-                    return Result.PLAY
+                    stack[-1].cursor = intval-1
+                    return Result.PLAY, None
                 else:
-                    stack.append(Breadcrumb(options[intval-1], options))
-                    return options[intval-1]
+                    stack.append(Breadcrumb(options, intval-1))
+                    return Result.OPTION, options[intval-1]
             else:
                 self.error('Unknown input, try again!')
                 continue
@@ -292,6 +366,8 @@ class App(BaseApp):
         Here we go!
         """
 
+        from rich import print
+
         print('')
         playing = False
         autoplaying = False
@@ -308,46 +384,56 @@ class App(BaseApp):
 
             if options is None:
 
-                # More hardcoding behavior based on Breadcrumb stack length.  c'est la vie!
-                match len(stack):
-
-                    case 0:
-                        options = [
-                                Option('NPCs', self.npc, 0),
-                                Option('Enemies', self.enemy, 1),
-                                Option('Loot', self.loot, 2),
-                                ]
-
-                    case 1:
-                        options = []
-                        for num, (name, bank) in enumerate(sorted(stack[-1].option.data.items())):
-                            options.append(Option(name, bank, num))
-
-                    case 2:
-                        options = []
-                        num = 0
-                        for key, name, category in stack[-1].option.data.groups:
-                            if len(category) > 0:
-                                options.append(Option(name, category, num))
-                                num += 1
-
-                    case 3:
-                        options = []
-                        total =  len(stack[-1].option.data)
-                        for num, (key, cue) in enumerate(stack[-1].option.data.items()):
-                            options.append(Option(key, cue, num, '([dim cyan]{}[/dim cyan]/[dim cyan]{}[/dim cyan]) {}'.format(
-                                num+1,
-                                total,
-                                key,
-                                )))
-
-                    case 4:
-                        playing = True
-                        options = []
-
-                    case _:
-                        self.error('Unknown state, exiting!')
-                        sys.exit(1)
+                # Memoize the built option lists, keyed by where we are in
+                # the tree -- rebuilding (and re-sorting) them on every
+                # navigation is O(n log n) per visit for the big registries.
+                # None of this data mutates at runtime, so the cache never
+                # needs invalidating.  (Level 4 stays out of the cache; that
+                # case also flips `playing` as a side effect.)
+                cache_key = tuple([id(s.option.data) for s in stack])
+                if len(stack) != 4 and cache_key in self._options_cache:
+                    options = self._options_cache[cache_key]
+                else:
+
+                    # More hardcoding behavior based on Breadcrumb stack length.  c'est la vie!
+                    match len(stack):
+
+                        case 0:
+                            options = self._root_options
+
+                        case 1:
+                            # Stash the sorted name/bank pairs on the registry
+                            # itself -- re-sorting a few hundred names on each
+                            # visit adds up, and registries never mutate at
+                            # runtime
+                            reg = stack[-1].option.data
+                            sorted_items = getattr(reg, '_sorted_items', None)
+                            if sorted_items is None:
+                                sorted_items = tuple(sorted(reg.items()))
+                                reg._sorted_items = sorted_items
+                            options = tuple(Option(name, bank)
+                                    for name, bank in sorted_items)
+
+                        case 2:
+                            options = tuple(Option(name, category)
+                                    for key, name, category in stack[-1].option.data.groups
+                                    if len(category) > 0)
+
+                        case 3:
+                            total = len(stack[-1].option.data)
+                            options = tuple(Option(key, cue, _cue_label % (num+1, total, key))
+                                    for num, (key, cue) in enumerate(stack[-1].option.data.items()))
+
+                        case 4:
+                            playing = True
+                            options = ()
+
+                        case _:
+                            self.error('Unknown state, exiting!')
+                            sys.exit(1)
+
+                    if len(stack) != 4:
+                        self._options_cache[cache_key] = options
 
             # Play, if we've been told to
             if playing:
@@ -356,14 +442,14 @@ class App(BaseApp):
 
             # If autoplaying, advance to the next and prompt...
             if autoplaying:
-                if stack[-1].option.pos < (len(stack[-1].prev_options)-1):
-                    try:
-                        # TODO: Might be nice to colorize this prompt, but I suspect it's using
-                        # sys.write() instead of print(), and rich tags don't get interpreted
-                        result = inputimeout.inputimeout(prompt='Hit Enter within 2 seconds to stop autoplay...', timeout=2)
+                if stack[-1].cursor < (len(stack[-1].options)-1):
+                    # TODO: Might be nice to colorize this prompt, but it's
+                    # written via sys.stdout directly, so rich tags don't
+                    # get interpreted
+                    if self._wait_for_enter('Hit Enter within 2 seconds to stop autoplay...', 2):
                         autoplaying = False
-                    except inputimeout.TimeoutOccurred:
-                        stack[-1].option = stack[-1].prev_options[stack[-1].option.pos+1]
+                    else:
+                        stack[-1].cursor += 1
                         print('')
                         continue
                 else:
@@ -371,32 +457,32 @@ class App(BaseApp):
                     # If we're done autoplaying, we may as well go back to the
                     # audio select menu rather than staying on this one, since
                     # we got to the end.
-                    options = stack.pop().prev_options
+                    options = stack.pop().options
                     playing = False
                     # ... and skip to the next iteration so we draw the menu properly
                     continue
 
             # Get user input
-            result = self.process_options(options, stack, playing=playing)
-
-            # match/case doesn't like this very well
-            if type(result) == Breadcrumb:
-                # We went back
-                options = result.prev_options
-                playing = False
-            elif type(result) == Option:
-                # We chose something new
-                options = None
-            elif result == Result.PLAY:
-                # Do nothing here, will play on the next refresh
-                pass
-            elif result == Result.AUTOPLAY:
-                autoplaying = True
-            elif result == Result.AUTOPLAY_ALL:
-                autoplaying = True
-                options = None
-            else:
-                raise RuntimeError('Unexpected result type: {}'.format(type(result)))
+            result, payload = self.process_options(options, stack, playing=playing)
+
+            match result:
+                case Result.BREADCRUMB:
+                    # We went back
+                    options = payload.options
+                    playing = False
+                case Result.OPTION:
+                    # We chose something new
+                    options = None
+                case Result.PLAY:
+                    # Do nothing here, will play on the next refresh
+                    pass
+                case Result.AUTOPLAY:
+                    autoplaying = True
+                case Result.AUTOPLAY_ALL:
+                    autoplaying = True
+                    options = None
+                case _:
+                    raise RuntimeError('Unexpected result: {}'.format(result))
 
 def main():
     app = App()